@@ -11,6 +11,7 @@
 # limitations under the License.
 import base64
 import json
+import os
 import subprocess
 import time
 import wave
@@ -18,6 +19,7 @@ from threading import Timer, Event
 from distutils.spawn import find_executable
 from enum import Enum
 from hashlib import md5
+from io import BytesIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from threading import Thread, RLock, Event
@@ -53,21 +55,42 @@ WATCHDOG_DELAY = 0.5
 
 def bytes2audiodata(data):
     recognizer = sr.Recognizer()
+    try:
+        with wave.open(BytesIO(data), "rb") as wav_file:
+            is_valid_wav = wav_file.getframerate() == 16000 and \
+                           wav_file.getsampwidth() == 2 and \
+                           wav_file.getnchannels() == 1
+    except (wave.Error, EOFError):
+        is_valid_wav = False
+
+    if is_valid_wav:
+        # already in the expected format, read it from memory
+        with sr.AudioFile(BytesIO(data)) as source:
+            return recognizer.record(source)
+
     with NamedTemporaryFile() as fp:
         fp.write(data)
+        # make sure the full payload is on disk before ffmpeg reads it
+        fp.flush()
 
+        converted = False
         if find_executable("ffmpeg"):
             p = fp.name + "converted.wav"
             # ensure file format
             cmd = ["ffmpeg", "-i", fp.name, "-acodec", "pcm_s16le", "-ar",
                    "16000", "-ac", "1", "-f", "wav", p, "-y"]
             subprocess.call(cmd)
+            converted = True
         else:
             LOG.warning("ffmpeg not found, please ensure audio is in a valid format")
             p = fp.name
 
-        with sr.AudioFile(p) as source:
-            audio = recognizer.record(source)
+        try:
+            with sr.AudioFile(p) as source:
+                audio = recognizer.record(source)
+        finally:
+            if converted and os.path.exists(p):
+                os.remove(p)
     return audio
 
 
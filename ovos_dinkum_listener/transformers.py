@@ -36,6 +36,7 @@ class AudioTransformersService:
     def __init__(self, bus, config=None):
         self.config_core = config or {}
         self.loaded_plugins = {}
+        self._sorted_plugins = ()
         self.has_loaded = False
         self.bus = bus
         # to activate a plugin, just add an entry to mycroft.conf for it
@@ -56,10 +57,14 @@ class AudioTransformersService:
                 except Exception as e:
                     LOG.exception(f"Failed to load audio transformer plugin: "
                                   f"{plug_name}")
+        # priority is fixed at load time, sort once instead of on every chunk
+        self._sorted_plugins = tuple(sorted(self.loaded_plugins.values(),
+                                            key=lambda k: k.priority,
+                                            reverse=True))
         self.has_loaded = True
 
     @property
-    def plugins(self) -> list:
+    def plugins(self) -> tuple:
         """
         Return loaded transformers in priority order, such that modules with a
         higher `priority` rank are called first and changes from lower ranked
@@ -67,9 +72,11 @@ class AudioTransformersService:
 
         A plugin of `priority` 1 will override any existing context keys and
         will be the last to modify `audio_data`
+
+        The order is computed in `load_plugins`, changes to `loaded_plugins`
+        must go through that method to be reflected here.
         """
-        return sorted(self.loaded_plugins.values(),
-                      key=lambda k: k.priority, reverse=True)
+        return self._sorted_plugins
 
     def shutdown(self):
         """
@@ -1,6 +1,7 @@
 from enum import Enum
 from threading import Event
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from ovos_config import Configuration
 from ovos_plugin_manager.wakewords import OVOSWakeWordFactory, HotWordEngine
@@ -16,15 +17,19 @@ class CyclicAudioBuffer:
     def __init__(self, duration=0.98, initial_data=None,
                  sample_rate=16000, sample_width=2):
         self.size = self.duration_to_bytes(duration, sample_rate, sample_width)
-        initial_data = initial_data or self.get_silence(self.size)
-        # Get at most size bytes from the end of the initial data
-        self._buffer = initial_data[-self.size:]
+        # Every byte is written twice, `size` bytes apart, so the last `size`
+        # bytes are always available as one contiguous slice
+        self._buffer = bytearray(2 * self.size)
+        self._idx = 0
+        if initial_data:
+            self.append(initial_data)
 
     def clear(self):
         """
         Set the buffer to empty data
         """
-        self._buffer = self.get_silence(self.size)
+        self._buffer = bytearray(2 * self.size)
+        self._idx = 0
 
     @staticmethod
     def duration_to_bytes(duration: float, sample_rate: int = 16000,
@@ -53,16 +58,26 @@ class CyclicAudioBuffer:
         @param data: binary data to append to the buffer.
             If buffer size is exceeded, the oldest data will be dropped.
         """
-        buff = self._buffer + data
-        if len(buff) > self.size:
-            buff = buff[-self.size:]
-        self._buffer = buff
+        if self.size <= 0:
+            # a zero length buffer never holds any data
+            return
+        data = memoryview(data)[-self.size:]
+        size = self.size
+        idx = self._idx
+        head = min(len(data), size - idx)
+        tail = len(data) - head
+        self._buffer[idx:idx + head] = data[:head]
+        self._buffer[idx + size:idx + size + head] = data[:head]
+        if tail:
+            self._buffer[:tail] = data[head:]
+            self._buffer[size:size + tail] = data[head:]
+        self._idx = (idx + len(data)) % size
 
     def get(self) -> bytes:
         """
         Get the binary audio data from the buffer
         """
-        return self._buffer
+        return bytes(memoryview(self._buffer)[self._idx:self._idx + self.size])
 
 
 class HotwordState(str, Enum):
@@ -88,6 +103,13 @@ def _safe_get_plugins(func):
 class HotwordContainer:
     _plugins = {}
     _loaded = Event()
+    # read-only index of `_plugins`, rebuilt by `_index_engines`
+    _engines = ()
+    _listen_words = MappingProxyType({})
+    _wakeup_words = MappingProxyType({})
+    _stop_words = MappingProxyType({})
+    _hot_words = MappingProxyType({})
+    _engines_by_state = MappingProxyType({})
 
     def __init__(self, bus=FakeBus(), expected_duration=3, sample_rate=16000,
                  sample_width=2):
@@ -99,6 +121,36 @@ class HotwordContainer:
                                               sample_width=sample_width)
         self.reload_on_failure = False
         self.applied_hotwords_config = None
+        self._index_engines()
+
+    @classmethod
+    def _index_engines(cls):
+        """
+        Group loaded engines by type. Read on every audio chunk, so this is
+        only recomputed when engines are loaded or removed. Stored on the
+        class, like `_plugins`, so every container sees the same index, and
+        exposed read-only so callers cannot modify it.
+        """
+        cls._engines = tuple(v["engine"] for v in cls._plugins.values())
+        cls._listen_words = MappingProxyType(
+            {k: v["engine"] for k, v in cls._plugins.items()
+             if v.get("listen")})
+        cls._wakeup_words = MappingProxyType(
+            {k: v["engine"] for k, v in cls._plugins.items()
+             if v.get("wakeup")})
+        cls._stop_words = MappingProxyType(
+            {k: v["engine"] for k, v in cls._plugins.items()
+             if v.get("stopword")})
+        cls._hot_words = MappingProxyType(
+            {k: v["engine"] for k, v in cls._plugins.items()
+             if not v.get("stopword") and
+             not v.get("wakeup") and
+             not v.get("listen")})
+        cls._engines_by_state = MappingProxyType(
+            {HotwordState.LISTEN: cls._listen_words,
+             HotwordState.WAKEUP: cls._wakeup_words,
+             HotwordState.RECORDING: cls._stop_words,
+             HotwordState.HOTWORD: cls._hot_words})
 
     def load_hotword_engines(self):
         """
@@ -154,31 +206,46 @@ class HotwordContainer:
                     continue
 
                 engine = OVOSWakeWordFactory.create_hotword(word, lang=lang)
-                if engine is not None:
-                    LOG.info(f"Loading hotword: {word} with engine: {engine}")
-                    if hasattr(engine, "bind"):
-                        engine.bind(self.bus)
-                        # not all plugins implement this
-                    if data.get('engine'):
-                        LOG.info(f"Engine previously defined. "
-                                 f"Deleting old instance.")
-                        try:
-                            data['engine'].stop()
-                            del data['engine']
-                        except Exception as e:
-                            LOG.error(e)
-                    self._plugins[word] = {"engine": engine,
-                                           "sound": sound,
-                                           "bus_event": event,
-                                           "trigger": trigger,
-                                           "utterance": utterance,
-                                           "stt_lang": lang,
-                                           "listen": listen,
-                                           "wakeup": wakeup,
-                                           "stopword": stopword}
+                if engine is None:
+                    continue
+                if not isinstance(engine, HotWordEngine):
+                    LOG.error(f"Expected HotWordEngine, but got: {engine} "
+                              f"for {word}")
+                    try:
+                        if hasattr(engine, "shutdown"):
+                            engine.shutdown()
+                    except Exception as e:
+                        LOG.error(e)
+                    if word in self._plugins:
+                        # a failed reload never drops a working engine
+                        LOG.warning(f"Keeping previously loaded engine for "
+                                    f"{word}")
+                    continue
+                LOG.info(f"Loading hotword: {word} with engine: {engine}")
+                if hasattr(engine, "bind"):
+                    engine.bind(self.bus)
+                    # not all plugins implement this
+                if data.get('engine'):
+                    LOG.info(f"Engine previously defined. "
+                             f"Deleting old instance.")
+                    try:
+                        data['engine'].stop()
+                        del data['engine']
+                    except Exception as e:
+                        LOG.error(e)
+                self._plugins[word] = {"engine": engine,
+                                       "sound": sound,
+                                       "bus_event": event,
+                                       "trigger": trigger,
+                                       "utterance": utterance,
+                                       "stt_lang": lang,
+                                       "listen": listen,
+                                       "wakeup": wakeup,
+                                       "stopword": stopword}
             except Exception as e:
                 LOG.error("Failed to load hotword: " + word)
 
+        self._index_engines()
         self._loaded.set()
 
         if not self.listen_words:
@@ -198,37 +265,39 @@ class HotwordContainer:
     @property
     @_safe_get_plugins
     def plugins(self):
-        return [v["engine"] for k, v in self._plugins.items()]
+        return self._engines
 
     @property
     @_safe_get_plugins
     def wakeup_words(self):
         """ wakeup words exit sleep mode if detected after a listen word"""
-        return {k: v["engine"] for k, v in self._plugins.items()
-                if v.get("wakeup")}
+        return self._wakeup_words
 
     @property
     @_safe_get_plugins
     def listen_words(self):
         """ listen words trigger the VAD/STT stages"""
-        return {k: v["engine"] for k, v in self._plugins.items()
-                if v.get("listen")}
+        return self._listen_words
 
     @property
     @_safe_get_plugins
     def stop_words(self):
         """ stop only work during recording mode, they exit recording mode"""
-        return {k: v["engine"] for k, v in self._plugins.items()
-                if v.get("stopword")}
+        return self._stop_words
 
     @property
     @_safe_get_plugins
     def hot_words(self):
         """ hotwords only emit bus events / play sounds, they do not affect listening loop"""
-        return {k: v["engine"] for k, v in self._plugins.items()
-                if not v.get("stopword") and
-                not v.get("wakeup") and
-                not v.get("listen")}
+        return self._hot_words
+
+    @_safe_get_plugins
+    def _get_engines(self) -> Mapping[str, HotWordEngine]:
+        """
+        Get the engines relevant to self.state
+        @return: read-only mapping of wake word name to engine
+        """
+        return self._engines_by_state.get(self.state, self._hot_words)
 
     def found(self) -> Optional[str]:
         """
@@ -237,33 +306,24 @@ class HotwordContainer:
         """
         # Check for which detectors we want; if none are active, log something
         # because it means there's no ww that "exits" the current state
-        if self.state == HotwordState.LISTEN:
-            engines = self.listen_words
-            if not engines:
+        engines = self._get_engines()
+        if not engines:
+            if self.state == HotwordState.LISTEN:
                 raise HotWordException(
                     f"Waiting for listen_words but none are available!")
-        elif self.state == HotwordState.WAKEUP:
-            engines = self.wakeup_words
-        elif self.state == HotwordState.RECORDING:
-            engines = self.stop_words
-        else:
-            engines = self.hot_words
+            # nothing to check, skip copying the audio buffer
+            return None
 
         # streaming engines will ignore the byte_data
         audio_data = self.audio_buffer.get()
         for ww_name, engine in engines.items():
             try:
-                assert isinstance(engine, HotWordEngine)
                 # non-streaming ww engines expect a 3-second cyclic buffer here
                 # streaming engines will ignore audio_data
                 # (got it via self.update)
                 if engine.found_wake_word(audio_data):
                     LOG.debug(f"Detected wake_word: {ww_name}")
                     return ww_name
-            except AssertionError:
-                LOG.error(f"Expected HotWordEngine, but got: {engine} for "
-                          f"{ww_name}")
-                # TODO: Add engine reload here?
             except Exception as e:
                 LOG.error(e)
         return None
@@ -290,20 +350,7 @@ class HotwordContainer:
         @param chunk: bytes of audio to feed to hotword engines
         """
         self.audio_buffer.append(chunk)
-        if self.state == HotwordState.LISTEN:
-            # LOG.debug(f"Update listen_words")
-            engines = self.listen_words.values()
-        elif self.state == HotwordState.WAKEUP:
-            # LOG.debug(f"Update wakeup_words")
-            engines = self.wakeup_words.values()
-        elif self.state == HotwordState.RECORDING:
-            # LOG.debug(f"Update stop_words")
-            engines = self.stop_words.values()
-        else:
-            # LOG.debug(f"Update hot_words")
-            engines = self.hot_words.values()
-
-        for engine in engines:
+        for engine in self._get_engines().values():
             try:
                 # old style engines will ignore the update
                 engine.update(chunk)
@@ -334,3 +381,4 @@ class HotwordContainer:
                 LOG.error(e)
         for ww in self.ww_names:
             self._plugins.pop(ww)
+        self._index_engines()
@@ -113,7 +113,7 @@ class DinkumVoiceLoop(VoiceLoop):
     skip_next_wake: bool = False
     hotword_chunks: Deque = field(default_factory=deque)
     stt_chunks: Deque = field(default_factory=deque)
-    stt_audio_bytes: bytes = bytes()
+    stt_audio_bytes: bytearray = field(default_factory=bytearray)
     last_ww: float = -1.0
     speech_seconds_left: float = 0.0
     silence_seconds_left: float = 0.0
@@ -134,6 +134,7 @@ class DinkumVoiceLoop(VoiceLoop):
     is_muted: bool = False
     _is_running: bool = False
     _chunk_info: ChunkInfo = field(default_factory=ChunkInfo)
+    _silence: bytes = bytes()
 
     @property
     def running(self) -> bool:
@@ -142,6 +143,16 @@ class DinkumVoiceLoop(VoiceLoop):
         """
         return self._is_running is True
 
+    @property
+    def _silent_chunk(self) -> bytes:
+        """
+        Silent chunk used while soft muted, resized whenever the mic chunk
+        size changes
+        """
+        if len(self._silence) != self.mic.chunk_size:
+            self._silence = bytes(self.mic.chunk_size)
+        return self._silence
+
     def start(self):
         """
         Start the Voice Loop; sets the listening mode based on configuration and
@@ -185,7 +196,7 @@ class DinkumVoiceLoop(VoiceLoop):
 
         # Keep hotword/STT audio so they can (optionally) be saved to disk
         self.hotword_chunks = deque(maxlen=self.num_hotword_keep_chunks)
-        self.stt_audio_bytes = bytes()
+        self.stt_audio_bytes = bytearray()
 
         # Audio from just before the wake word is detected is kept for STT.
         # This allows you to speak a command immediately after the wake word.
@@ -204,7 +215,7 @@ class DinkumVoiceLoop(VoiceLoop):
 
             if self.is_muted:
                 # Soft mute
-                chunk = bytes(self.mic.chunk_size)
+                chunk = self._silent_chunk
 
             self._chunk_info.is_speech = False
             self._chunk_info.energy = 0.0
@@ -314,10 +325,20 @@ class DinkumVoiceLoop(VoiceLoop):
         #  finished recording
         if self.recording_audio_callback is not None:
             metadata = {"recording_name": self.recording_filename}
-            self.recording_audio_callback(self.stt_audio_bytes, metadata)
+            self.recording_audio_callback(bytes(self.stt_audio_bytes),
+                                          metadata)
         LOG.debug("Finished recording")
         self.reset_state()
 
+    def _pop_hotword_audio(self) -> bytes:
+        """
+        Remove all buffered hotword chunks and return them as one bytes object
+        @return: bytes of audio buffered before the hotword detection
+        """
+        hotword_audio_bytes = b"".join(self.hotword_chunks)
+        self.hotword_chunks.clear()
+        return hotword_audio_bytes
+
     def _in_recording(self, chunk: bytes):
         """
         Handle a chunk of audio while in the `RECORDING` state.
@@ -342,9 +363,7 @@ class DinkumVoiceLoop(VoiceLoop):
 
             # Callback to handle recorded hotword audio
             if self.stopword_audio_callback is not None:
-                hotword_audio_bytes = bytes()
-                while self.hotword_chunks:
-                    hotword_audio_bytes += self.hotword_chunks.popleft()
+                hotword_audio_bytes = self._pop_hotword_audio()
                 self.stopword_audio_callback(hotword_audio_bytes,
                                              self.hotwords.get_ww(ww))
         else:
@@ -383,9 +402,7 @@ class DinkumVoiceLoop(VoiceLoop):
 
             # Callback to handle recorded hotword audio
             if self.wakeupword_audio_callback is not None:
-                hotword_audio_bytes = bytes()
-                while self.hotword_chunks:
-                    hotword_audio_bytes += self.hotword_chunks.popleft()
+                hotword_audio_bytes = self._pop_hotword_audio()
                 self.wakeupword_audio_callback(hotword_audio_bytes,
                                                self.hotwords.get_ww(ww))
 
@@ -411,9 +428,7 @@ class DinkumVoiceLoop(VoiceLoop):
         if ww:
             # Callback to handle recorded hotword audio
             if self.hotword_audio_callback is not None:
-                hotword_audio_bytes = bytes()
-                while self.hotword_chunks:
-                    hotword_audio_bytes += self.hotword_chunks.popleft()
+                hotword_audio_bytes = self._pop_hotword_audio()
                 self.hotword_audio_callback(hotword_audio_bytes,
                                             self.hotwords.get_ww(ww))
                 self.transformers.feed_hotword(chunk)
@@ -445,9 +460,7 @@ class DinkumVoiceLoop(VoiceLoop):
             if (self.listenword_audio_callback is not None) and (
                     not self.skip_next_wake
             ):
-                hotword_audio_bytes = bytes()
-                while self.hotword_chunks:
-                    hotword_audio_bytes += self.hotword_chunks.popleft()
+                hotword_audio_bytes = self._pop_hotword_audio()
 
                 self.listenword_audio_callback(hotword_audio_bytes,
                                                self.hotwords.get_ww(ww))
@@ -469,7 +482,7 @@ class DinkumVoiceLoop(VoiceLoop):
                 self.speech_seconds_left = self.speech_seconds
                 self.timeout_seconds_left = self.timeout_seconds
                 self.timeout_seconds_with_silence_left = self.timeout_seconds_with_silence                
-                self.stt_audio_bytes = bytes()
+                self.stt_audio_bytes = bytearray()
                 self.stt.stream_start()
                 if self.fallback_stt is not None:
                     self.fallback_stt.stream_start()
@@ -663,10 +676,11 @@ class DinkumVoiceLoop(VoiceLoop):
         # Command has ended, call transformers pipeline before STT
         chunk, stt_context = self.transformers.transform(chunk)
 
+        stt_audio_bytes = bytes(self.stt_audio_bytes)
         if isinstance(self.stt, FakeStreamingSTT) and self.remove_silence:
             # NOTE: This is using the FS-STT buffer directly, not the S-STT queue
             self.stt.stream.buffer.clear()
-            extracted_speech = self.vad.extract_speech(self.stt_audio_bytes)
+            extracted_speech = self.vad.extract_speech(stt_audio_bytes)
             # only deposit non empty audio
             if extracted_speech:
                 LOG.debug("removed silence from utterance")
@@ -681,9 +695,9 @@ class DinkumVoiceLoop(VoiceLoop):
             LOG.info("nothing transcribed")
         # Voice command has finished recording
         if self.stt_audio_callback is not None:
-            self.stt_audio_callback(self.stt_audio_bytes, stt_context)
+            self.stt_audio_callback(stt_audio_bytes, stt_context)
 
-        self.stt_audio_bytes = bytes()
+        self.stt_audio_bytes = bytearray()
 
         # Callback to handle STT text
         if self.text_callback is not None:
@@ -1,9 +1,36 @@
 import unittest
+from unittest.mock import Mock, patch
 
 
 class TestCyclicAudioBuffer(unittest.TestCase):
     from ovos_dinkum_listener.voice_loop.hotwords import CyclicAudioBuffer
-    # TODO
+
+    def test_append_get(self):
+        buffer = self.CyclicAudioBuffer(duration=0.5, sample_rate=8,
+                                        sample_width=1)
+        self.assertEqual(buffer.size, 4)
+        self.assertEqual(buffer.get(), bytes(4))
+
+        buffer.append(b'ab')
+        self.assertEqual(buffer.get(), b'\0\0ab')
+        buffer.append(b'cde')
+        self.assertEqual(buffer.get(), b'bcde')
+        buffer.append(b'fghijk')
+        self.assertEqual(buffer.get(), b'hijk')
+        buffer.append(b'')
+        self.assertEqual(buffer.get(), b'hijk')
+
+        buffer.clear()
+        self.assertEqual(buffer.get(), bytes(4))
+
+        buffer = self.CyclicAudioBuffer(duration=0.5, sample_rate=8,
+                                        sample_width=1, initial_data=b'xyzuvw')
+        self.assertEqual(buffer.get(), b'zuvw')
+
+        buffer = self.CyclicAudioBuffer(duration=0)
+        self.assertEqual(buffer.size, 0)
+        buffer.append(b'ab')
+        self.assertEqual(buffer.get(), b'')
 
 
 class TestHotwordState(unittest.TestCase):
@@ -18,8 +45,110 @@ class TestHotwordState(unittest.TestCase):
 
 class TestHotwordContainer(unittest.TestCase):
     from ovos_dinkum_listener.voice_loop.hotwords import HotwordContainer
-    # TODO
 
+    def setUp(self) -> None:
+        # loaded state and engine index are shared by all containers,
+        # restore them after any patches made by the test are undone
+        self.addCleanup(self.HotwordContainer._index_engines)
+        self.addCleanup(self.HotwordContainer._loaded.clear)
+
+    def test_class_defaults(self):
+        from types import MappingProxyType
+        # index is declared on the class, next to `_plugins`
+        self.assertIsInstance(self.HotwordContainer._engines, tuple)
+        for attr in ("_listen_words", "_wakeup_words", "_stop_words",
+                     "_hot_words", "_engines_by_state"):
+            self.assertIsInstance(getattr(self.HotwordContainer, attr),
+                                  MappingProxyType)
+
+    def test_engines_by_state(self):
+        from ovos_plugin_manager.templates.hotwords import HotWordEngine
+        from ovos_dinkum_listener.voice_loop.hotwords import HotwordState, \
+            HotWordException
+        listen = Mock(spec=HotWordEngine)
+        listen.found_wake_word.return_value = False
+        stop = Mock(spec=HotWordEngine)
+        stop.found_wake_word.return_value = True
+        hot = Mock(spec=HotWordEngine)
+        hot.found_wake_word.return_value = False
+
+        plugins = {"listen": {"engine": listen, "listen": True},
+                   "stop": {"engine": stop, "stopword": True},
+                   "hot": {"engine": hot}}
+        patcher = patch.object(self.HotwordContainer, "_plugins", plugins)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        container = self.HotwordContainer()
+        other_container = self.HotwordContainer()
+        container._index_engines()
+        container._loaded.set()
+        self.assertEqual(container.listen_words, {"listen": listen})
+        self.assertEqual(container.stop_words, {"stop": stop})
+        self.assertEqual(container.hot_words, {"hot": hot})
+        self.assertEqual(container.wakeup_words, dict())
+        # index is shared with other containers
+        self.assertEqual(other_container.listen_words, {"listen": listen})
+        # index is read-only
+        with self.assertRaises(TypeError):
+            container.listen_words["other"] = hot
+        self.assertIsInstance(container.plugins, tuple)
+
+        container.state = HotwordState.LISTEN
+        container.update(b'01')
+        listen.update.assert_called_once_with(b'01')
+        stop.update.assert_not_called()
+        self.assertIsNone(container.found())
+
+        container.state = HotwordState.RECORDING
+        container.update(b'02')
+        stop.update.assert_called_once_with(b'02')
+        self.assertEqual(container.found(), "stop")
+
+        container.state = HotwordState.HOTWORD
+        container.update(b'03')
+        hot.update.assert_called_once_with(b'03')
+        listen.update.assert_called_once()
+
+        # No wakeup words, nothing is checked
+        container.state = HotwordState.WAKEUP
+        container.audio_buffer.get = Mock()
+        self.assertIsNone(container.found())
+        container.audio_buffer.get.assert_not_called()
+
+        # No listen words, but waiting for one
+        plugins.pop("listen")
+        plugins.pop("stop")
+        other_container._index_engines()
+        self.assertEqual(container.listen_words, dict())
+        container.state = HotwordState.LISTEN
+        with self.assertRaises(HotWordException):
+            container.found()
+
+
+    @patch("ovos_dinkum_listener.voice_loop.hotwords.OVOSWakeWordFactory")
+    @patch("ovos_dinkum_listener.voice_loop.hotwords.Configuration")
+    def test_load_rejects_invalid_engine(self, config, factory):
+        from ovos_plugin_manager.templates.hotwords import HotWordEngine
+        config.return_value = {
+            "listener": {"wake_word": "hey_test"},
+            "hotwords": {"hey_test": {"module": "mock", "listen": True}}}
+        previous = Mock(spec=HotWordEngine)
+        plugins = {"hey_test": {"engine": previous, "listen": True}}
+        patcher = patch.object(self.HotwordContainer, "_plugins", plugins)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Reload produces an engine that is not a HotWordEngine
+        invalid = Mock()
+        factory.create_hotword.return_value = invalid
+        container = self.HotwordContainer()
+        container.load_hotword_engines()
+        invalid.shutdown.assert_called_once()
+        invalid.bind.assert_not_called()
+        # previously loaded engine is kept running
+        self.assertEqual(container.listen_words, {"hey_test": previous})
+        previous.shutdown.assert_not_called()
 
 if __name__ == '__main__':
     unittest.main()
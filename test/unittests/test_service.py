@@ -1,14 +1,17 @@
 import shutil
 import unittest
+import wave
 
+from io import BytesIO
 from os import environ, makedirs
-from os.path import join, dirname
+from os.path import join, dirname, exists
 from threading import Event
 from time import sleep
 from unittest.mock import Mock, patch
 
 from ovos_utils.messagebus import FakeBus
 from ovos_utils.process_utils import ProcessState
+from speech_recognition import AudioData
 
 
 class TestDinkumVoiceService(unittest.TestCase):
@@ -436,5 +439,56 @@ class TestDinkumVoiceService(unittest.TestCase):
         self.service.hotwords.load_hotword_engines = real_create_hotwords
 
 
+def _get_wav_bytes(frames: bytes) -> bytes:
+    wav_io = BytesIO()
+    with wave.open(wav_io, "wb") as wav_file:
+        wav_file.setframerate(16000)
+        wav_file.setsampwidth(2)
+        wav_file.setnchannels(1)
+        wav_file.writeframes(frames)
+    return wav_io.getvalue()
+
+
+class TestBytes2AudioData(unittest.TestCase):
+    frames = bytes(range(256)) * 64
+
+    @patch("ovos_dinkum_listener.service.find_executable")
+    @patch("ovos_dinkum_listener.service.subprocess")
+    def test_bytes2audiodata_wav(self, subprocess, find_executable):
+        from ovos_dinkum_listener.service import bytes2audiodata
+        find_executable.return_value = "/usr/bin/ffmpeg"
+        audio = bytes2audiodata(_get_wav_bytes(self.frames))
+        self.assertIsInstance(audio, AudioData)
+        self.assertEqual(audio.sample_rate, 16000)
+        self.assertEqual(audio.sample_width, 2)
+        self.assertEqual(audio.get_raw_data(), self.frames)
+        # expected format is not converted with ffmpeg
+        subprocess.call.assert_not_called()
+
+    @patch("ovos_dinkum_listener.service.find_executable")
+    @patch("ovos_dinkum_listener.service.subprocess")
+    def test_bytes2audiodata_ffmpeg(self, subprocess, find_executable):
+        from ovos_dinkum_listener.service import bytes2audiodata
+        find_executable.return_value = "/usr/bin/ffmpeg"
+
+        payload = b"not a wav file"
+
+        def _convert(cmd):
+            # ffmpeg reads the input after `-i`
+            with open(cmd[cmd.index("-i") + 1], "rb") as f:
+                self.assertEqual(f.read(), payload)
+            # ffmpeg writes the converted wav to the path before `-y`
+            with open(cmd[-2], "wb") as f:
+                f.write(_get_wav_bytes(self.frames))
+
+        subprocess.call.side_effect = _convert
+        audio = bytes2audiodata(payload)
+        subprocess.call.assert_called_once()
+        converted_path = subprocess.call.call_args[0][0][-2]
+        self.assertEqual(audio.get_raw_data(), self.frames)
+        # converted file is removed after it was read
+        self.assertFalse(exists(converted_path))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -35,7 +35,7 @@ class TestTransformers(unittest.TestCase):
                          config['listener']['audio_transformers'])
         self.assertTrue(service.has_loaded)
         self.assertEqual(service.loaded_plugins, dict())
-        self.assertEqual(service.plugins, list())
+        self.assertEqual(service.plugins, tuple())
 
         # Call methods to ensure no exceptions are raised
         service.feed_audio(b'00')
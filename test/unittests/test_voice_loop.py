@@ -90,7 +90,7 @@ class TestDinkumVoiceLoop(unittest.TestCase):
         self.assertIsInstance(self.loop.skip_next_wake, bool)
         self.assertIsInstance(self.loop.hotword_chunks, Deque)
         self.assertIsInstance(self.loop.stt_chunks, Deque)
-        self.assertIsInstance(self.loop.stt_audio_bytes, bytes)
+        self.assertIsInstance(self.loop.stt_audio_bytes, bytearray)
         self.assertIsInstance(self.loop.last_ww, float)
         self.assertIsInstance(self.loop.speech_seconds_left, float)
         self.assertIsInstance(self.loop.silence_seconds_left, float)
@@ -209,6 +209,21 @@ class TestDinkumVoiceLoop(unittest.TestCase):
         self.loop._detect_ww = real_detect_ww
         self.loop.debiased_energy = real_debiased_energy
 
+    def test_silent_chunk(self):
+        from ovos_plugin_manager.templates.microphone import Microphone
+        loop = self.DinkumVoiceLoop(mic=Microphone(chunk_size=4096),
+                                    hotwords=self.hotwords, stt=self.stt,
+                                    fallback_stt=self.fallback_stt,
+                                    vad=self.vad,
+                                    transformers=self.transformers)
+        self.assertEqual(loop._silent_chunk, bytes(4096))
+
+        # Silence follows a resized or replaced mic
+        loop.mic.chunk_size = 1024
+        self.assertEqual(loop._silent_chunk, bytes(1024))
+        loop.mic = Microphone(chunk_size=2048)
+        self.assertEqual(loop._silent_chunk, bytes(2048))
+
 
 if __name__ == '__main__':
     unittest.main()